@@ -3,8 +3,12 @@ backend/main.py
 
 Servicio REST con FastAPI para clasificar mensajes de texto.
 Usa la cadena de LangChain definida en `chains.py` y devuelve respuestas estructuradas con Pydantic.
+Al arrancar calienta el modelo en segundo plano; `/ready` devuelve 503 hasta que termina.
 """
 
+import asyncio
+import threading
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.responses import JSONResponse
 from fastapi.middleware import Middleware
@@ -13,6 +17,44 @@ from chains import MessageClassificationChain
 from models import MessageRequest, ClassificationResponse, ErrorResponse
 from utils.logger import log_info, log_error
 from utils.errors import handle_error
+from classifier import warmup_classifier
+from config import WARMUP_ENABLED
+
+# -----------------------------
+# Estado de preparación del servicio
+# -----------------------------
+readiness = {"ready": False, "warmup": None, "error": None}
+
+# Señal para detener el calentamiento entre pasadas al apagar el servidor
+warmup_stop = threading.Event()
+
+def run_service_warmup():
+    """
+    Calienta el modelo y marca el servicio como listo, o registra el error si falla.
+    """
+    try:
+        if WARMUP_ENABLED:
+            readiness["warmup"] = warmup_classifier(stop_event=warmup_stop)
+            if readiness["warmup"]["cancelled"]:
+                return
+        readiness["ready"] = True
+        log_info("Servicio listo para clasificar mensajes")
+    except Exception as e:
+        log_error(f"El calentamiento del modelo falló; el servicio no está listo: {str(e)}")
+        readiness["error"] = handle_error(e)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Lanza el calentamiento en un hilo aparte para que el servidor acepte conexiones
+    (y `/ready` responda 503) mientras se calienta el modelo. Al apagar, lo detiene
+    y espera como mucho a que termine la pasada en curso.
+    """
+    warmup_stop.clear()
+    warmup_task = asyncio.create_task(asyncio.to_thread(run_service_warmup))
+    yield
+    warmup_stop.set()
+    await warmup_task
 
 # -----------------------------
 # Inicialización de la aplicación
@@ -20,7 +62,8 @@ from utils.errors import handle_error
 app = FastAPI(
     title="Clasificador de Mensajes",
     description="API REST para clasificar mensajes en categorías: Urgente, Moderado, Normal",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # -----------------------------
@@ -56,10 +99,16 @@ async def log_requests(request: Request, call_next):
 # -----------------------------
 # Endpoint de clasificación
 # -----------------------------
-@app.post("/classify", response_model=ClassificationResponse, responses={400: {"model": ErrorResponse}})
+@app.post(
+    "/classify",
+    response_model=ClassificationResponse,
+    responses={400: {"model": ErrorResponse}, 503: {"model": ErrorResponse}}
+)
 async def classify_message_endpoint(request: MessageRequest):
     """
     Endpoint para clasificar un mensaje de texto.
+    Responde 503 hasta que el calentamiento termina, para no compartir el modelo
+    con el hilo de calentamiento ni atender peticiones con el modelo en frío.
     
     Args:
         request (MessageRequest): Mensaje de texto a clasificar.
@@ -67,6 +116,16 @@ async def classify_message_endpoint(request: MessageRequest):
     Returns:
         ClassificationResponse: Resultado de la clasificación.
     """
+    if not readiness["ready"]:
+        return JSONResponse(
+            status_code=503,
+            content=ErrorResponse(
+                error="ServiceNotReady",
+                message="El modelo aún se está calentando; consulta /ready",
+                details={"error": readiness["error"]} if readiness["error"] else {}
+            ).model_dump()
+        )
+
     try:
         result = classification_chain.invoke({"message": request.message})
         # Devuelve el resultado directamente
@@ -80,6 +139,21 @@ async def classify_message_endpoint(request: MessageRequest):
             details=error_response
         )
 
+# -----------------------------
+# Endpoint de preparación
+# -----------------------------
+@app.get("/ready")
+async def ready_endpoint():
+    """
+    Indica si el modelo está cargado y calentado.
+
+    Returns:
+        JSONResponse: Estado de preparación y tiempos de arranque (503 mientras se calienta
+        o si el calentamiento falló, con el detalle en "error").
+    """
+    status_code = 200 if readiness["ready"] else 503
+    return JSONResponse(status_code=status_code, content=readiness)
+
 # -----------------------------
 # Punto de entrada para ejecutar el servidor
 # -----------------------------
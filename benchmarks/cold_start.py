@@ -0,0 +1,94 @@
+"""
+benchmarks/cold_start.py
+
+Benchmark del arranque en frío del clasificador.
+Cada ejecución lanza un proceso nuevo que importa `classifier` (carga del modelo),
+ejecuta el calentamiento y mide la primera clasificación real.
+
+Uso:
+    python -m benchmarks.cold_start [--runs 3] [--output cold_start.jsonl]
+"""
+
+import os
+import sys
+import json
+import argparse
+import tempfile
+import subprocess
+from datetime import datetime, timezone
+
+# Directorio raíz del proyecto (donde viven `classifier.py` y `config.py`)
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Código ejecutado en cada proceso hijo; escribe los tiempos como JSON en el archivo recibido
+CHILD_SCRIPT = """
+import json, sys, time
+process_started_at = time.perf_counter()
+import classifier
+stats = classifier.warmup_classifier()
+start = time.perf_counter()
+classifier.classify_message("El edificio está en llamas.")
+first_request_latency = time.perf_counter() - start
+stats["import_seconds"] = classifier.LOAD_STARTED_AT - process_started_at
+stats["first_request_latency"] = first_request_latency
+stats["cold_start_seconds"] = time.perf_counter() - process_started_at
+with open(sys.argv[1], "w", encoding="utf-8") as f:
+    json.dump(stats, f)
+"""
+
+# -----------------------------
+# Ejecución de una medición
+# -----------------------------
+def measure_cold_start() -> dict:
+    """
+    Mide un arranque en frío completo en un proceso independiente.
+
+    Returns:
+        dict: Tiempos de la ejecución (carga, calentamiento, primera latencia buena, etc.).
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        result_path = os.path.join(tmp_dir, "cold_start.json")
+        try:
+            subprocess.run(
+                [sys.executable, "-c", CHILD_SCRIPT, result_path],
+                cwd=PROJECT_ROOT,
+                capture_output=True,
+                text=True,
+                check=True
+            )
+        except subprocess.CalledProcessError as e:
+            print(f"El proceso de medición falló (código {e.returncode}):\n{e.stderr}", file=sys.stderr)
+            raise SystemExit(1) from e
+
+        with open(result_path, encoding="utf-8") as f:
+            return json.load(f)
+
+# -----------------------------
+# Punto de entrada del benchmark
+# -----------------------------
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Mide el tiempo de arranque en frío del clasificador")
+    parser.add_argument("--runs", type=int, default=3, help="Número de arranques a medir")
+    parser.add_argument("--output", help="Archivo JSONL donde añadir los resultados para su seguimiento")
+    args = parser.parse_args()
+    if args.runs < 1:
+        parser.error("--runs debe ser al menos 1")
+
+    results = []
+    for i in range(args.runs):
+        result = measure_cold_start()
+        result["timestamp"] = datetime.now(timezone.utc).isoformat()
+        results.append(result)
+        first_good = result["time_to_first_good_latency"]
+        print(f"Arranque {i + 1}/{args.runs}: frío={result['cold_start_seconds']:.2f}s | "
+              f"carga={result['model_load_seconds']:.2f}s | "
+              f"primera latencia buena={f'{first_good:.2f}s' if first_good is not None else 'n/d'} | "
+              f"primera petición={result['first_request_latency'] * 1000:.1f}ms")
+
+    cold_starts = sorted(r["cold_start_seconds"] for r in results)
+    print(f"Mediana de arranque en frío ({results[0]['model_source']}): {cold_starts[len(cold_starts) // 2]:.2f}s")
+
+    if args.output:
+        with open(args.output, "a", encoding="utf-8") as f:
+            for result in results:
+                f.write(json.dumps(result) + "\n")
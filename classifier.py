@@ -5,21 +5,46 @@ Lógica de clasificación de mensajes utilizando Zero-Shot Classification de Hug
 Integra logging, manejo de errores personalizados y configuraciones globales.
 """
 
+import time
+
+# Instante de inicio del arranque, tomado antes de importar torch/transformers para que el
+# tiempo de importación cuente en el arranque en frío (misma referencia que el benchmark)
+LOAD_STARTED_AT = time.perf_counter()
+
 from transformers import pipeline
-from config import MODEL_NAME, CANDIDATE_LABELS, CONFIDENCE_THRESHOLD
+from config import (
+    MODEL_NAME, CANDIDATE_LABELS, CONFIDENCE_THRESHOLD, MODEL_SNAPSHOT_DIR,
+    WARMUP_TOKEN_LENGTHS, WARMUP_ROUNDS
+)
+from snapshot import snapshot_available
+from warmup import run_warmup
 from utils.logger import log_info, log_debug, log_error, log_warning
 from utils.errors import ModelLoadingError, InvalidInputError, UnexpectedError
 
 # -----------------------------
 # Carga global del modelo (una sola vez)
 # -----------------------------
+if snapshot_available(MODEL_SNAPSHOT_DIR):
+    MODEL_SOURCE = MODEL_SNAPSHOT_DIR
+    model_kwargs = {"use_safetensors": True}
+else:
+    MODEL_SOURCE = MODEL_NAME
+    model_kwargs = {}
+    log_warning(f"No hay snapshot en '{MODEL_SNAPSHOT_DIR}'; se carga '{MODEL_NAME}' desde Hugging Face (ejecuta `python snapshot.py`)")
+
 try:
-    log_info(f"Cargando modelo de clasificación: {MODEL_NAME}")
-    classifier = pipeline("zero-shot-classification", model=MODEL_NAME)
-    log_debug(f"Modelo '{MODEL_NAME}' cargado correctamente")
+    log_info(f"Cargando modelo de clasificación: {MODEL_SOURCE}")
+    classifier = pipeline(
+        "zero-shot-classification",
+        model=MODEL_SOURCE,
+        tokenizer=MODEL_SOURCE,
+        model_kwargs=model_kwargs
+    )
+    MODEL_LOAD_SECONDS = time.perf_counter() - LOAD_STARTED_AT
+    log_debug(f"Modelo '{MODEL_SOURCE}' cargado correctamente en {MODEL_LOAD_SECONDS:.2f}s")
 except Exception as e:
-    log_error(f"No se pudo cargar el modelo '{MODEL_NAME}': {str(e)}")
-    raise ModelLoadingError(f"No se pudo cargar el modelo '{MODEL_NAME}'", details={"error": str(e)})
+    log_error(f"No se pudo cargar el modelo '{MODEL_SOURCE}': {str(e)}")
+    raise ModelLoadingError(f"No se pudo cargar el modelo '{MODEL_SOURCE}'", details={"error": str(e)})
 
 # -----------------------------
 # Función principal de clasificación
@@ -75,6 +100,24 @@ def classify_message(text: str) -> dict:
         log_error(f"Error durante la clasificación: {str(e)}")
         raise UnexpectedError(f"Error durante la clasificación: {str(e)}", details={"error": str(e)}) from e
 
+# -----------------------------
+# Calentamiento del modelo
+# -----------------------------
+def warmup_classifier(token_lengths=WARMUP_TOKEN_LENGTHS, rounds: int = WARMUP_ROUNDS, stop_event=None) -> dict:
+    """
+    Calienta el modelo cargado para que torch inicialice sus kernels y el tokenizer quede en caliente.
+
+    Args:
+        token_lengths (list): Longitudes de mensaje en tokens.
+        rounds (int): Repeticiones por longitud (mínimo 2).
+        stop_event (threading.Event, opcional): Detiene el calentamiento entre pasadas.
+
+    Returns:
+        dict: Origen y tiempo de carga del modelo más los tiempos de `warmup.run_warmup`.
+    """
+    stats = run_warmup(classifier, LOAD_STARTED_AT, token_lengths, rounds, stop_event=stop_event)
+    return {"model_source": MODEL_SOURCE, "model_load_seconds": MODEL_LOAD_SECONDS, **stats}
+
 # -----------------------------
 # Ejemplo de uso (para pruebas locales)
 # -----------------------------
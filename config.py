@@ -8,6 +8,8 @@ configuración de logs y otros parámetros reutilizables.
 Evita repetir valores en múltiples archivos y centraliza la gestión de configuraciones.
 """
 
+import os
+
 # -----------------------------
 # Categorías de clasificación
 # -----------------------------
@@ -26,6 +28,36 @@ MAX_LENGTH = 512  # BART maneja hasta 512 tokens
 # Umbral mínimo de confianza para aceptar una clasificación
 CONFIDENCE_THRESHOLD = 0.5  # 50% de confianza mínima
 
+# -----------------------------
+# Snapshot local del modelo
+# -----------------------------
+# Directorio donde `snapshot.py` guarda tokenizer y pesos (safetensors).
+# Si existe, el clasificador carga desde aquí en lugar del caché de Hugging Face.
+MODEL_SNAPSHOT_DIR = os.getenv("MODEL_SNAPSHOT_DIR", "model_snapshot")
+
+# -----------------------------
+# Calentamiento (warm-up) del modelo
+# -----------------------------
+# Ejecuta inferencias de prueba al arrancar el servidor antes de marcarlo como listo
+WARMUP_ENABLED = True
+
+# Longitudes representativas del mensaje, en tokens. Cada pasada replica la llamada real de
+# `classify_message`: un solo texto que el pipeline expande a len(CANDIDATE_LABELS) pares
+WARMUP_TOKEN_LENGTHS = [16, 64, 256, MAX_LENGTH]
+
+# Repeticiones por cada longitud (mínimo 2: la primera pasada es la fría)
+WARMUP_ROUNDS = 3
+
+# Latencia objetivo en segundos para considerar una pasada "buena" (None = sin objetivo fijo)
+WARMUP_TARGET_LATENCY = None
+
+# Sin objetivo fijo, una pasada es "buena" si no supera este factor sobre la mínima
+# de las pasadas posteriores a la primera en su misma longitud
+WARMUP_GOOD_LATENCY_FACTOR = 1.5
+
+# Mensaje base usado para generar los textos de calentamiento
+WARMUP_MESSAGE = "El servidor principal no responde y los clientes no pueden acceder. "
+
 # -----------------------------
 # Configuración de logs
 # -----------------------------
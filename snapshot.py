@@ -0,0 +1,154 @@
+"""
+snapshot.py
+
+Preparación de un snapshot local del modelo para arranques rápidos.
+Guarda el tokenizer y los pesos en formato safetensors, que `transformers` carga
+mediante mmap, evitando la descarga o la lectura del caché de Hugging Face.
+
+Uso:
+    python snapshot.py [--model facebook/bart-large-mnli] [--output model_snapshot]
+"""
+
+import os
+import json
+import shutil
+import argparse
+import tempfile
+from config import MODEL_NAME, MODEL_SNAPSHOT_DIR
+from utils.logger import log_info, log_error, log_warning
+from utils.errors import ModelLoadingError
+
+# Archivo con metadatos del snapshot (modelo de origen, versiones)
+SNAPSHOT_METADATA_FILE = "snapshot.json"
+
+# Archivos del tokenizer rápido que debe contener el snapshot
+TOKENIZER_FILES = ("tokenizer_config.json", "tokenizer.json")
+
+# -----------------------------
+# Comprobación del snapshot
+# -----------------------------
+def snapshot_available(snapshot_dir: str = MODEL_SNAPSHOT_DIR, model_name: str = MODEL_NAME) -> bool:
+    """
+    Indica si existe un snapshot completo, en formato safetensors y del modelo configurado.
+
+    Args:
+        snapshot_dir (str): Directorio del snapshot.
+        model_name (str): Modelo esperado; debe coincidir con el guardado en los metadatos.
+
+    Returns:
+        bool: True si el directorio contiene configuración, tokenizer y pesos safetensors
+        del modelo esperado.
+    """
+    if not os.path.isfile(os.path.join(snapshot_dir, "config.json")):
+        return False
+
+    has_weights = any(
+        os.path.isfile(os.path.join(snapshot_dir, name))
+        for name in ("model.safetensors", "model.safetensors.index.json")
+    )
+    if not has_weights:
+        log_warning(f"El snapshot '{snapshot_dir}' no contiene pesos en formato safetensors")
+        return False
+
+    missing = [name for name in TOKENIZER_FILES if not os.path.isfile(os.path.join(snapshot_dir, name))]
+    if missing:
+        log_warning(f"El snapshot '{snapshot_dir}' está incompleto; faltan archivos del tokenizer: {missing}")
+        return False
+
+    try:
+        with open(os.path.join(snapshot_dir, SNAPSHOT_METADATA_FILE), encoding="utf-8") as f:
+            saved_model = json.load(f).get("model_name")
+    except (OSError, ValueError) as e:
+        log_warning(f"No se pudieron leer los metadatos del snapshot '{snapshot_dir}': {str(e)}")
+        return False
+
+    if saved_model != model_name:
+        log_warning(f"El snapshot '{snapshot_dir}' es de '{saved_model}' pero el modelo configurado es "
+                    f"'{model_name}'; vuelve a ejecutar `python snapshot.py`")
+        return False
+
+    return True
+
+# -----------------------------
+# Creación del snapshot
+# -----------------------------
+def _replace_dir(src_dir: str, dst_dir: str):
+    """
+    Sustituye `dst_dir` por `src_dir`, restaurando el original si el cambio falla.
+    """
+    if not os.path.exists(dst_dir):
+        os.replace(src_dir, dst_dir)
+        return
+
+    backup_dir = f"{src_dir}-old"
+    os.replace(dst_dir, backup_dir)
+    try:
+        os.replace(src_dir, dst_dir)
+    except OSError:
+        os.replace(backup_dir, dst_dir)
+        raise
+    shutil.rmtree(backup_dir, ignore_errors=True)
+
+def save_snapshot(model_name: str = MODEL_NAME, snapshot_dir: str = MODEL_SNAPSHOT_DIR) -> str:
+    """
+    Descarga (o lee del caché) el modelo y lo guarda como snapshot local.
+    El snapshot se construye en un directorio temporal junto al destino y solo sustituye
+    al anterior cuando está completo, para que una ejecución fallida nunca deje uno mezclado.
+
+    Args:
+        model_name (str): Nombre o ruta del modelo de Hugging Face.
+        snapshot_dir (str): Directorio de destino.
+
+    Returns:
+        str: Ruta del snapshot creado.
+
+    Raises:
+        ModelLoadingError: Si el modelo no se puede cargar o guardar.
+    """
+    log_info(f"Creando snapshot de '{model_name}' en '{snapshot_dir}'")
+
+    try:
+        import transformers
+        from transformers import AutoModelForSequenceClassification, AutoTokenizer
+
+        tokenizer = AutoTokenizer.from_pretrained(model_name, use_fast=True)
+        model = AutoModelForSequenceClassification.from_pretrained(model_name)
+
+        parent_dir = os.path.dirname(os.path.abspath(snapshot_dir))
+        os.makedirs(parent_dir, exist_ok=True)
+        tmp_dir = tempfile.mkdtemp(prefix=".snapshot-", dir=parent_dir)
+
+        try:
+            model.save_pretrained(tmp_dir, safe_serialization=True)
+            tokenizer.save_pretrained(tmp_dir)
+
+            with open(os.path.join(tmp_dir, SNAPSHOT_METADATA_FILE), "w", encoding="utf-8") as f:
+                json.dump(
+                    {"model_name": model_name, "transformers_version": transformers.__version__},
+                    f,
+                    indent=2
+                )
+
+            _replace_dir(tmp_dir, snapshot_dir)
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+    except Exception as e:
+        log_error(f"No se pudo crear el snapshot de '{model_name}': {str(e)}")
+        raise ModelLoadingError(
+            f"No se pudo crear el snapshot de '{model_name}'",
+            details={"error": str(e), "snapshot_dir": snapshot_dir}
+        ) from e
+
+    log_info(f"Snapshot guardado en '{snapshot_dir}'")
+    return snapshot_dir
+
+# -----------------------------
+# Punto de entrada del comando de preparación
+# -----------------------------
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Guarda un snapshot local del modelo para arranques rápidos")
+    parser.add_argument("--model", default=MODEL_NAME, help="Modelo de Hugging Face de origen")
+    parser.add_argument("--output", default=MODEL_SNAPSHOT_DIR, help="Directorio de destino del snapshot")
+    args = parser.parse_args()
+
+    save_snapshot(args.model, args.output)
@@ -0,0 +1,113 @@
+"""
+tests/test_ready.py
+
+Pruebas del estado de preparación del servicio (`/ready`) y del bloqueo de `/classify`
+durante el calentamiento. Sustituye `classifier` y `chains` para no cargar el modelo.
+"""
+
+import sys
+import time
+import types
+import threading
+import importlib
+import pytest
+from fastapi.testclient import TestClient
+
+WARMUP_STATS = {"cancelled": False, "model_source": "fake", "time_to_first_good_latency": 1.0}
+
+
+class FakeChain:
+    """Cadena falsa que devuelve siempre la misma clasificación."""
+
+    def invoke(self, inputs):
+        return {"result": {"classification": "Urgente", "confidence": 0.9, "details": {}}}
+
+
+@pytest.fixture
+def main(monkeypatch):
+    fake_classifier = types.ModuleType("classifier")
+    fake_classifier.warmup_classifier = lambda stop_event=None: WARMUP_STATS
+    fake_chains = types.ModuleType("chains")
+    fake_chains.MessageClassificationChain = FakeChain
+
+    monkeypatch.setitem(sys.modules, "classifier", fake_classifier)
+    monkeypatch.setitem(sys.modules, "chains", fake_chains)
+    monkeypatch.delitem(sys.modules, "backend.main", raising=False)
+    module = importlib.import_module("backend.main")
+    yield module
+    sys.modules.pop("backend.main", None)
+
+
+def wait_until(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "tiempo de espera agotado"
+        time.sleep(0.01)
+
+
+def test_ready_is_503_while_warming_then_200_with_stats(main, monkeypatch):
+    release = threading.Event()
+
+    def slow_warmup(stop_event=None):
+        release.wait(5)
+        return WARMUP_STATS
+
+    monkeypatch.setattr(main, "warmup_classifier", slow_warmup)
+
+    with TestClient(main.app) as client:
+        response = client.get("/ready")
+        assert response.status_code == 503
+        assert response.json()["ready"] is False
+        assert client.post("/classify", json={"message": "Hay un incendio"}).status_code == 503
+
+        release.set()
+        wait_until(lambda: main.readiness["ready"])
+
+        response = client.get("/ready")
+        assert response.status_code == 200
+        assert response.json()["warmup"] == WARMUP_STATS
+        assert client.post("/classify", json={"message": "Hay un incendio"}).status_code == 200
+
+
+def test_ready_reports_warmup_error(main, monkeypatch):
+    def failing_warmup(stop_event=None):
+        raise RuntimeError("fallo de inferencia")
+
+    monkeypatch.setattr(main, "warmup_classifier", failing_warmup)
+
+    with TestClient(main.app) as client:
+        wait_until(lambda: main.readiness["error"] is not None)
+
+        response = client.get("/ready")
+        assert response.status_code == 503
+        assert response.json()["error"]["message"] == "fallo de inferencia"
+        assert client.post("/classify", json={"message": "Hay un incendio"}).status_code == 503
+
+
+def test_ready_without_warmup(main, monkeypatch):
+    monkeypatch.setattr(main, "WARMUP_ENABLED", False)
+    monkeypatch.setattr(main, "warmup_classifier", lambda stop_event=None: pytest.fail("no debe calentarse"))
+
+    with TestClient(main.app) as client:
+        wait_until(lambda: main.readiness["ready"])
+
+        response = client.get("/ready")
+        assert response.status_code == 200
+        assert response.json()["warmup"] is None
+
+
+def test_shutdown_stops_warmup(main, monkeypatch):
+    started = threading.Event()
+
+    def stoppable_warmup(stop_event=None):
+        started.set()
+        stop_event.wait(5)
+        return {**WARMUP_STATS, "cancelled": True}
+
+    monkeypatch.setattr(main, "warmup_classifier", stoppable_warmup)
+
+    with TestClient(main.app):
+        assert started.wait(5)
+
+    assert main.warmup_stop.is_set()
+    assert main.readiness["ready"] is False
@@ -0,0 +1,110 @@
+"""
+tests/test_snapshot.py
+
+Pruebas de la validación del snapshot local del modelo.
+"""
+
+import os
+import sys
+import json
+import types
+import pytest
+from snapshot import snapshot_available, save_snapshot, SNAPSHOT_METADATA_FILE, TOKENIZER_FILES
+from utils.errors import ModelLoadingError
+
+MODEL = "facebook/bart-large-mnli"
+
+
+def make_snapshot(path, model_name=MODEL, files=None):
+    """Crea un snapshot falso con los archivos indicados (por defecto, todos)."""
+    files = files if files is not None else ["config.json", "model.safetensors", *TOKENIZER_FILES]
+    for name in files:
+        (path / name).write_text("{}")
+    (path / SNAPSHOT_METADATA_FILE).write_text(json.dumps({"model_name": model_name}))
+    return str(path)
+
+
+def test_complete_snapshot_is_available(tmp_path):
+    assert snapshot_available(make_snapshot(tmp_path), MODEL)
+
+
+def test_missing_directory_is_not_available(tmp_path):
+    assert not snapshot_available(str(tmp_path / "no_existe"), MODEL)
+
+
+def test_missing_weights_is_not_available(tmp_path):
+    path = make_snapshot(tmp_path, files=["config.json", *TOKENIZER_FILES])
+    assert not snapshot_available(path, MODEL)
+
+
+def test_missing_tokenizer_is_not_available(tmp_path):
+    path = make_snapshot(tmp_path, files=["config.json", "model.safetensors"])
+    assert not snapshot_available(path, MODEL)
+
+
+def test_missing_metadata_is_not_available(tmp_path):
+    path = make_snapshot(tmp_path)
+    (tmp_path / SNAPSHOT_METADATA_FILE).unlink()
+    assert not snapshot_available(path, MODEL)
+
+
+def test_snapshot_of_other_model_is_not_available(tmp_path):
+    path = make_snapshot(tmp_path, model_name="otro/modelo")
+    assert not snapshot_available(path, MODEL)
+
+
+class FakeSaveable:
+    """Modelo o tokenizer falso que escribe sus archivos, o falla a mitad si se indica."""
+
+    def __init__(self, files, fail=False):
+        self.files = files
+        self.fail = fail
+
+    def save_pretrained(self, path, **kwargs):
+        for name in self.files:
+            with open(os.path.join(path, name), "w") as f:
+                f.write("nuevo")
+            if self.fail:
+                raise OSError("disco lleno")
+
+
+@pytest.fixture
+def fake_transformers(monkeypatch):
+    module = types.ModuleType("transformers")
+    module.__version__ = "0.0-test"
+    module.fail_model = False
+    module.AutoTokenizer = types.SimpleNamespace(
+        from_pretrained=lambda name, **kwargs: FakeSaveable(TOKENIZER_FILES)
+    )
+    module.AutoModelForSequenceClassification = types.SimpleNamespace(
+        from_pretrained=lambda name, **kwargs: FakeSaveable(
+            ["config.json", "model.safetensors"], fail=module.fail_model
+        )
+    )
+    monkeypatch.setitem(sys.modules, "transformers", module)
+    return module
+
+
+def test_save_snapshot_replaces_previous_snapshot(tmp_path, fake_transformers):
+    target = tmp_path / "model_snapshot"
+    target.mkdir()
+    make_snapshot(target, model_name="otro/modelo")
+
+    save_snapshot(MODEL, str(target))
+
+    assert snapshot_available(str(target), MODEL)
+    assert (target / "model.safetensors").read_text() == "nuevo"
+    assert sorted(os.listdir(tmp_path)) == ["model_snapshot"]
+
+
+def test_failed_save_keeps_previous_snapshot_intact(tmp_path, fake_transformers):
+    target = tmp_path / "model_snapshot"
+    target.mkdir()
+    make_snapshot(target)
+    fake_transformers.fail_model = True
+
+    with pytest.raises(ModelLoadingError):
+        save_snapshot(MODEL, str(target))
+
+    assert (target / "model.safetensors").read_text() == "{}"
+    assert sorted(os.listdir(tmp_path)) == ["model_snapshot"]
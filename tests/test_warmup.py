@@ -0,0 +1,118 @@
+"""
+tests/test_warmup.py
+
+Pruebas del calentamiento y del cálculo de la primera latencia buena,
+usando un pipeline falso con reloj simulado.
+"""
+
+import threading
+import pytest
+import warmup
+from warmup import build_warmup_text, run_warmup, time_to_good_latency
+from utils.errors import ConfigurationError, UnexpectedError
+
+
+class FakeTokenizer:
+    """Tokenizer falso: un token por palabra."""
+
+    def __call__(self, text, add_special_tokens=False):
+        return {"input_ids": text.split()}
+
+    def decode(self, ids):
+        return " ".join(ids)
+
+
+class FakePipeline:
+    """Pipeline falso que avanza un reloj simulado según una lista de latencias."""
+
+    def __init__(self, latencies, clock):
+        self.latencies = list(latencies)
+        self.clock = clock
+        self.tokenizer = FakeTokenizer()
+        self.calls = []
+
+    def __call__(self, text, candidate_labels):
+        self.calls.append((text, candidate_labels))
+        self.clock["now"] += self.latencies.pop(0)
+        return {"labels": candidate_labels, "scores": [1.0] * len(candidate_labels)}
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    state = {"now": 0.0}
+    monkeypatch.setattr(warmup.time, "perf_counter", lambda: state["now"])
+    return state
+
+
+def make_runs(length, latencies):
+    runs, now = [], 0.0
+    for latency in latencies:
+        now += latency
+        runs.append({"length": length, "latency": latency, "finished_at": now})
+    return runs
+
+
+def test_build_warmup_text_has_requested_token_count():
+    text = build_warmup_text(FakeTokenizer(), 7, message="uno dos tres")
+    assert len(text.split()) == 7
+
+
+def test_cold_first_run_is_not_good():
+    runs = make_runs(16, [5.0, 0.1])
+    assert time_to_good_latency(runs, target_latency=None, factor=1.5) == pytest.approx(5.1)
+
+
+def test_good_latency_waits_for_every_length():
+    runs = make_runs(16, [5.0, 0.1, 0.1])
+    for run in make_runs(512, [2.0, 0.3, 0.3]):
+        run["finished_at"] += 5.2
+        runs.append(run)
+    assert time_to_good_latency(runs, target_latency=None, factor=1.5) == pytest.approx(7.5)
+
+
+def test_absolute_target_latency():
+    runs = make_runs(16, [5.0, 0.4, 0.2])
+    assert time_to_good_latency(runs, target_latency=0.3) == pytest.approx(5.6)
+    assert time_to_good_latency(runs, target_latency=0.1) is None
+
+
+def test_run_warmup_rejects_single_round(clock):
+    with pytest.raises(ConfigurationError):
+        run_warmup(FakePipeline([], clock), 0.0, token_lengths=[16], rounds=1)
+
+
+def test_run_warmup_uses_production_call_and_reports_stats(clock):
+    pipe = FakePipeline([5.0, 0.1, 0.1, 0.5, 0.3, 0.3], clock)
+    clock["now"] = 2.0  # carga del modelo
+    stats = run_warmup(pipe, 0.0, token_lengths=[16, 64], rounds=3, target_latency=None)
+
+    assert [len(text.split()) for text, _ in pipe.calls] == [16] * 3 + [64] * 3
+    assert stats["warmup_seconds"] == pytest.approx(6.3)
+    # 16 tokens en caliente tras la segunda pasada; 64 tokens tras la quinta (0.3 * 1.5 >= 0.3)
+    assert stats["time_to_first_good_latency"] == pytest.approx(2.0 + 5.0 + 0.1 + 0.1 + 0.5 + 0.3)
+    assert stats["steady_latencies"] == [
+        {"length": 16, "latency": pytest.approx(0.1)},
+        {"length": 64, "latency": pytest.approx(0.3)},
+    ]
+
+
+def test_run_warmup_wraps_pipeline_errors(clock):
+    pipe = FakePipeline([], clock)
+    with pytest.raises(UnexpectedError):
+        run_warmup(pipe, 0.0, token_lengths=[16], rounds=2)
+
+
+def test_run_warmup_stops_between_passes(clock):
+    stop_event = threading.Event()
+
+    class StoppingPipeline(FakePipeline):
+        def __call__(self, text, candidate_labels):
+            stop_event.set()
+            return super().__call__(text, candidate_labels)
+
+    pipe = StoppingPipeline([1.0, 1.0, 1.0], clock)
+    stats = run_warmup(pipe, 0.0, token_lengths=[16], rounds=3, stop_event=stop_event)
+
+    assert len(pipe.calls) == 1
+    assert stats["cancelled"] is True
+    assert stats["time_to_first_good_latency"] is None
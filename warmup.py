@@ -0,0 +1,162 @@
+"""
+warmup.py
+
+Calentamiento del pipeline de clasificación antes de aceptar peticiones.
+Ejecuta la misma llamada que `classify_message` sobre mensajes de longitudes
+representativas (en tokens) y mide cuándo la latencia alcanza un valor bueno.
+"""
+
+import time
+import threading
+from typing import Any, Dict, List, Optional
+from config import (
+    CANDIDATE_LABELS, WARMUP_TOKEN_LENGTHS, WARMUP_ROUNDS, WARMUP_TARGET_LATENCY,
+    WARMUP_GOOD_LATENCY_FACTOR, WARMUP_MESSAGE
+)
+from utils.logger import log_info, log_debug, log_error, log_warning
+from utils.errors import ConfigurationError, UnexpectedError
+
+# -----------------------------
+# Generación de textos de calentamiento
+# -----------------------------
+def build_warmup_text(tokenizer: Any, num_tokens: int, message: str = WARMUP_MESSAGE) -> str:
+    """
+    Genera un texto de aproximadamente `num_tokens` tokens repitiendo el mensaje base.
+    El texto se decodifica y el pipeline lo vuelve a tokenizar; con BPE ese ida y vuelta
+    puede variar ligeramente el número de tokens (ej: si el corte cae a mitad de palabra).
+
+    Args:
+        tokenizer (Any): Tokenizer del pipeline.
+        num_tokens (int): Longitud deseada en tokens (sin tokens especiales).
+        message (str): Mensaje base a repetir.
+
+    Returns:
+        str: Texto decodificado con una longitud cercana a la pedida.
+    """
+    ids = tokenizer(message, add_special_tokens=False)["input_ids"]
+    repeated = (ids * (num_tokens // len(ids) + 1))[:num_tokens]
+    return tokenizer.decode(repeated)
+
+# -----------------------------
+# Cálculo de la primera latencia buena
+# -----------------------------
+def time_to_good_latency(
+    runs: List[Dict[str, float]],
+    target_latency: Optional[float] = WARMUP_TARGET_LATENCY,
+    factor: float = WARMUP_GOOD_LATENCY_FACTOR
+) -> Optional[float]:
+    """
+    Calcula el instante en que todas las longitudes alcanzan una latencia buena.
+
+    Con `target_latency` una pasada es buena si no lo supera. Sin él, el objetivo de cada
+    longitud es `factor` veces la mínima de sus pasadas posteriores a la primera (en caliente).
+
+    Args:
+        runs (List[Dict[str, float]]): Pasadas con "length", "latency" y "finished_at", en orden.
+        target_latency (Optional[float]): Latencia objetivo fija en segundos.
+        factor (float): Tolerancia sobre la latencia en caliente si no hay objetivo fijo.
+
+    Returns:
+        Optional[float]: Valor de "finished_at" de la última longitud en alcanzar su objetivo,
+        o None si alguna no lo alcanza.
+    """
+    by_length: Dict[int, List[Dict[str, float]]] = {}
+    for run in runs:
+        by_length.setdefault(run["length"], []).append(run)
+
+    reached = []
+    for length_runs in by_length.values():
+        if target_latency is not None:
+            target = target_latency
+        else:
+            target = min(run["latency"] for run in length_runs[1:]) * factor
+
+        good = next((run for run in length_runs if run["latency"] <= target), None)
+        if good is None:
+            return None
+        reached.append(good["finished_at"])
+
+    return max(reached) if reached else None
+
+# -----------------------------
+# Ejecución del calentamiento
+# -----------------------------
+def run_warmup(
+    pipe: Any,
+    started_at: float,
+    token_lengths: List[int] = WARMUP_TOKEN_LENGTHS,
+    rounds: int = WARMUP_ROUNDS,
+    target_latency: Optional[float] = WARMUP_TARGET_LATENCY,
+    stop_event: Optional[threading.Event] = None
+) -> Dict[str, Any]:
+    """
+    Calienta el pipeline de Zero-Shot Classification con la misma llamada que usa producción.
+
+    Args:
+        pipe (Any): Pipeline de clasificación (con atributo `tokenizer`).
+        started_at (float): Instante (`time.perf_counter`) desde el que medir la primera latencia buena.
+        token_lengths (List[int]): Longitudes de mensaje en tokens.
+        rounds (int): Repeticiones por longitud; al menos 2.
+        target_latency (Optional[float]): Latencia objetivo fija en segundos.
+        stop_event (Optional[threading.Event]): Si se activa, el calentamiento se detiene
+            antes de la siguiente pasada (ej: al apagar el servidor).
+
+    Returns:
+        Dict[str, Any]: Tiempos del calentamiento (ej: {"time_to_first_good_latency": 4.2, ...});
+        con "cancelled": True si se detuvo antes de terminar.
+
+    Raises:
+        ConfigurationError: Si `rounds` es menor que 2.
+        UnexpectedError: Si falla alguna inferencia de calentamiento.
+    """
+    if rounds < 2:
+        raise ConfigurationError(
+            "El calentamiento necesita al menos 2 rondas por longitud",
+            details={"rounds": rounds}
+        )
+
+    log_info(f"Iniciando calentamiento del modelo ({len(token_lengths)} longitudes x {rounds} rondas)")
+    warmup_started_at = time.perf_counter()
+    runs = []
+
+    try:
+        for length in token_lengths:
+            text = build_warmup_text(pipe.tokenizer, length)
+
+            for _ in range(rounds):
+                if stop_event is not None and stop_event.is_set():
+                    log_info(f"Calentamiento detenido tras {len(runs)} pasadas")
+                    return {
+                        "cancelled": True,
+                        "warmup_seconds": time.perf_counter() - warmup_started_at,
+                        "time_to_first_good_latency": None,
+                        "steady_latencies": []
+                    }
+
+                start = time.perf_counter()
+                pipe(text, candidate_labels=CANDIDATE_LABELS)
+                finished_at = time.perf_counter()
+                runs.append({"length": length, "latency": finished_at - start, "finished_at": finished_at})
+                log_debug(f"Calentamiento longitud={length} tokens: {finished_at - start:.3f}s")
+    except Exception as e:
+        log_error(f"Error durante el calentamiento: {str(e)}")
+        raise UnexpectedError(f"Error durante el calentamiento: {str(e)}", details={"error": str(e)}) from e
+
+    good_at = time_to_good_latency(runs, target_latency)
+    stats = {
+        "cancelled": False,
+        "warmup_seconds": time.perf_counter() - warmup_started_at,
+        "time_to_first_good_latency": good_at - started_at if good_at is not None else None,
+        "steady_latencies": [
+            {"length": length, "latency": min(run["latency"] for run in runs[i * rounds + 1:(i + 1) * rounds])}
+            for i, length in enumerate(token_lengths)
+        ]
+    }
+
+    if stats["time_to_first_good_latency"] is not None:
+        log_info(f"Calentamiento completado en {stats['warmup_seconds']:.2f}s | "
+                 f"Tiempo hasta la primera latencia buena: {stats['time_to_first_good_latency']:.2f}s")
+    else:
+        log_warning(f"Calentamiento completado en {stats['warmup_seconds']:.2f}s sin alcanzar "
+                    f"la latencia objetivo ({target_latency}s) en todas las longitudes")
+    return stats